@@ -5,20 +5,25 @@ Creates realistic commit history for workdays (Mon-Fri) only.
 """
 
 import argparse
+import os
 import random
+import shlex
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from pathlib import Path
+from itertools import chain
+from string import Formatter
+from typing import NamedTuple
 
 # Realistic commit message templates
 COMMIT_MESSAGES = {
-    "morning": [
+    "morning": (
         "Start day: review PR queue and plan tasks",
         "Daily standup notes and sprint planning",
         "Check overnight builds and CI status",
         "Morning sync: align on priorities",
         "Review emails and update task board",
-    ],
-    "development": [
+    ),
+    "development": (
         "Implement feature: {component}",
         "Refactor {component} for better performance",
         "Add tests for {component}",
@@ -27,169 +32,235 @@ COMMIT_MESSAGES = {
         "Optimize {component} query performance",
         "Integrate {component} with API",
         "Add validation to {component}",
-    ],
-    "bugfix": [
+    ),
+    "bugfix": (
         "Fix bug: {issue} causing {symptom}",
         "Hotfix: resolve {issue} in production",
         "Debug and fix {issue}",
         "Address code review feedback on {issue}",
         "Fix regression in {issue}",
-    ],
-    "review": [
+    ),
+    "review": (
         "Code review: {pr}",
         "Review and approve PR: {pr}",
         "Leave feedback on {pr}",
         "Pair programming session on {feature}",
         "Mentoring session: review {feature}",
-    ],
-    "planning": [
+    ),
+    "planning": (
         "Update sprint backlog",
         "Write technical spec for {feature}",
         "Estimate tasks for next sprint",
         "Document {feature} architecture decision",
         "Update README with {feature} instructions",
-    ],
-    "endofday": [
+    ),
+    "endofday": (
         "Wrap up: commit WIP on {feature}",
         "End of day: save progress on {feature}",
         "Checkpoint: {feature} progress",
         "Daily commit: {feature} updates",
         "Push EOD changes for {feature}",
-    ],
+    ),
 }
 
-COMPONENTS = [
+COMPONENTS = (
     "user authentication", "payment gateway", "dashboard API", "data pipeline",
     "notification service", "user profile", "search functionality", "reporting module",
     "cache layer", "database migrations", "API endpoints", "frontend components",
     "background jobs", "webhook handlers", "error logging", "metrics collection",
     "config management", "security middleware", "rate limiting", "audit trail",
-]
+)
 
-ISSUES = [
+ISSUES = (
     "memory leak", "race condition", "null pointer", "authentication timeout",
-    "database deadlock", "race condition", "validation error", "indexing issue",
+    "database deadlock", "validation error", "indexing issue",
     "session handling", "token refresh", "data sync", "cache invalidation",
-]
+)
 
-SYMPTOMS = [
+SYMPTOMS = (
     "slow response times", "intermittent failures", "login errors", "data inconsistency",
     "timeout issues", "crashes", "incorrect totals", "missing notifications",
-]
+)
 
-PRS = [
+PRS = (
     "#1423", "#1425", "#1428", "#1430", "#1432",
     "user-auth-refactor", "payment-fix", "dashboard-v2", "api-cleanup",
-]
+)
 
-FEATURES = [
+FEATURES = (
     "new onboarding flow", "analytics dashboard", "bulk export", "real-time updates",
     "mobile optimization", "accessibility improvements", "dark mode", "SSO integration",
     "audit logging", "rate limiting", "caching layer", "API v2",
-]
+)
 
+# Value pools for each template placeholder
+PLACEHOLDER_VALUES = {
+    "component": COMPONENTS,
+    "issue": ISSUES,
+    "symptom": SYMPTOMS,
+    "pr": PRS,
+    "feature": FEATURES,
+}
 
-def generate_commit_message(hour: int) -> str:
-    """Generate a realistic commit message based on time of day."""
+
+class Commit(NamedTuple):
+    """A generated commit: its log timestamp, ISO date for git, and message."""
+    timestamp: str
+    iso_timestamp: str
+    message: str
+
+
+def compile_template(template: str) -> tuple:
+    """Convert a str.format template to a %-template and its placeholder pools."""
+    parts = []
+    pools = []
+    for literal, field, _, _ in Formatter().parse(template):
+        parts.append(literal.replace('%', '%%'))
+        if field is not None:
+            parts.append('%s')
+            pools.append(PLACEHOLDER_VALUES[field])
+    return ''.join(parts), tuple(pools)
+
+
+# Commit categories for each part of the workday
+MORNING_CATEGORIES = ("morning",)
+WORKING_CATEGORIES = ("development", "bugfix", "review")
+LUNCH_CATEGORIES = ("planning", "review")
+ENDOFDAY_CATEGORIES = ("endofday",)
+
+
+def categories_for_hour(hour: int) -> tuple:
+    """Return the commit categories that fit a given hour of the day."""
     if hour < 10:
-        category = "morning"
+        return MORNING_CATEGORIES
     elif hour < 12:
-        category = random.choice(["development", "bugfix", "review"])
+        return WORKING_CATEGORIES
     elif hour < 14:
-        category = random.choice(["planning", "review"])
+        return LUNCH_CATEGORIES
     elif hour < 17:
-        category = random.choice(["development", "bugfix", "review"])
+        return WORKING_CATEGORIES
     else:
-        category = "endofday"
-    
-    template = random.choice(COMMIT_MESSAGES[category])
-    
-    # Fill in placeholders
-    message = template.format(
-        component=random.choice(COMPONENTS),
-        issue=random.choice(ISSUES),
-        symptom=random.choice(SYMPTOMS),
-        pr=random.choice(PRS),
-        feature=random.choice(FEATURES),
+        return ENDOFDAY_CATEGORIES
+
+
+# Templates per category, pre-parsed into (%-template, placeholder pools)
+COMPILED_MESSAGES = {
+    category: tuple(compile_template(template) for template in templates)
+    for category, templates in COMMIT_MESSAGES.items()
+}
+
+# Every candidate template for each work hour (9:00-17:59), indexed by hour - 9
+HOUR_TO_TEMPLATE_POOL = tuple(
+    tuple(
+        compiled
+        for category in categories_for_hour(hour)
+        for compiled in COMPILED_MESSAGES[category]
     )
-    
-    return message
+    for hour in range(9, 18)
+)
+
 
+def generate_commit_message(hour: int, rng: random.Random) -> str:
+    """Generate a realistic commit message based on time of day."""
+    template, pools = rng.choice(HOUR_TO_TEMPLATE_POOL[hour - 9])
+    return template % tuple([rng.choice(pool) for pool in pools])
 
-def is_workday(date: datetime) -> bool:
-    """Check if date is a weekday (Mon-Fri)."""
-    return date.weekday() < 5  # Monday=0, Friday=4
 
+def is_workday(ordinal: int) -> bool:
+    """Check if a proleptic Gregorian ordinal falls on a weekday (Mon-Fri)."""
+    return (ordinal - 1) % 7 < 5  # Ordinal 1 (0001-01-01) is a Monday
+
+
+# One commit per second of the 9:00-18:00 window at most
+MAX_COMMITS_PER_DAY = 9 * 3600
+
+
+def schedule_day(num_commits: int, rng: random.Random) -> list:
+    """Return commit times for a day as seconds after 9:00, in order."""
+    if num_commits <= 0:
+        return []
+    if num_commits > MAX_COMMITS_PER_DAY:
+        raise ValueError(
+            f"num_commits must be at most {MAX_COMMITS_PER_DAY}, got {num_commits}"
+        )
+    
+    # Split 9:00-18:00 into equal slots and place one commit in each,
+    # so commits come out in chronological order without sorting
+    slot = MAX_COMMITS_PER_DAY // num_commits
+    randrange = rng.randrange
+    return [start + randrange(slot) for start in range(0, slot * num_commits, slot)]
 
-def generate_commits_for_day(date: datetime, num_commits: int, filename: str) -> list:
+
+def generate_commits_for_day(date: datetime, num_commits: int, rng: random.Random) -> list:
     """Generate commit commands for a single workday."""
     commits = []
     
-    # Distribute commits between 9:00 and 18:00
-    work_hours = list(range(9, 18))
-    selected_hours = sorted(random.sample(work_hours, min(num_commits, len(work_hours))))
-    
-    # If we need more commits than hours, add some within the same hour
-    while len(selected_hours) < num_commits:
-        selected_hours.append(random.choice(work_hours))
-    selected_hours = sorted(selected_hours[:num_commits])
+    # Bind hot lookups locally; this loop runs once per generated commit
+    append = commits.append
+    year, month, day = date.year, date.month, date.day
     
-    for i, hour in enumerate(selected_hours):
-        minute = random.randint(0, 59)
-        second = random.randint(0, 59)
-        
-        commit_time = date.replace(hour=hour, minute=minute, second=second)
-        timestamp = commit_time.strftime("%Y-%m-%d %H:%M:%S")
-        iso_timestamp = commit_time.strftime("%Y-%m-%dT%H:%M:%S")
+    for offset in schedule_day(num_commits, rng):
+        hour, rest = divmod(offset, 3600)
+        minute, second = divmod(rest, 60)
+        hour += 9
         
-        message = generate_commit_message(hour)
+        fields = (year, month, day, hour, minute, second)
+        timestamp = "%04d-%02d-%02d %02d:%02d:%02d" % fields
+        iso_timestamp = "%04d-%02d-%02dT%02d:%02d:%02d" % fields
         
-        # Generate content for the file
-        content_line = f"[{timestamp}] {message}\n"
-        
-        commits.append({
-            'timestamp': timestamp,
-            'iso_timestamp': iso_timestamp,
-            'message': message,
-            'content': content_line,
-        })
+        append(Commit(timestamp, iso_timestamp, generate_commit_message(hour, rng)))
     
     return commits
 
 
-def generate_shell_script(commits: list, filename: str, output_path: str) -> str:
-    """Generate a shell script that creates the commits."""
-    script_lines = [
+def generate_seeded_day(task: tuple) -> list:
+    """Generate one day's commits from its own seeded RNG; runs in worker processes."""
+    date, num_commits, seed = task
+    return generate_commits_for_day(date, num_commits, random.Random(seed))
+
+
+# Shell commands emitted for every commit, filled with %-formatting
+COMMIT_TEMPLATE = (
+    "# Commit: %s\n"
+    "echo %s >> \"$FILE\"\n"
+    "GIT_AUTHOR_DATE='%s' GIT_COMMITTER_DATE='%s' "
+    "git -c commit.gpgsign=false commit -m %s -- \"$FILE\"\n"
+    "\n"
+)
+
+
+def stream_shell_script(commits: list, filename: str):
+    """Yield the shell script that creates the commits, one block at a time."""
+    yield "\n".join([
         "#!/bin/bash",
         "# Auto-generated commit script",
         "# Run this in your git repository",
         "",
         "set -e",
         "",
-        f'FILE="{filename}"',
+        f'FILE={shlex.quote(filename)}',
         "",
-        "# Ensure file exists",
+        "# Ensure file exists and is tracked",
         'touch "$FILE"',
+        'git add "$FILE"',
         "",
-    ]
+        "",
+    ])
     
     for commit in commits:
-        script_lines.extend([
-            f"# Commit: {commit['message']}",
-            f"echo '{commit['content'].rstrip()}' >> \"$FILE\"",
-            f"export GIT_AUTHOR_DATE='{commit['iso_timestamp']}'",
-            f"export GIT_COMMITTER_DATE='{commit['iso_timestamp']}'",
-            f"git add \"$FILE\"",
-            f"git commit -m '{commit['message']}'",
-            "",
-        ])
+        timestamp, iso, message = commit
+        yield COMMIT_TEMPLATE % (
+            message,
+            shlex.quote(f"[{timestamp}] {message}"),
+            iso,
+            iso,
+            shlex.quote(message),
+        )
     
-    script_lines.extend([
+    yield "\n".join([
         "echo 'All commits created successfully!'",
         "git log --oneline -10",
     ])
-    
-    return '\n'.join(script_lines)
 
 
 def main():
@@ -248,8 +319,25 @@ def main():
         default=-1,
         help='Number of vacation days to simulate (default: ~8%% of workdays)'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Worker processes for commit generation (default: 1)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        help='Random seed for reproducible output (default: random)'
+    )
     
     args = parser.parse_args()
+    if not 0 <= args.min_commits <= args.max_commits <= MAX_COMMITS_PER_DAY:
+        parser.error(
+            f'--min-commits and --max-commits must satisfy '
+            f'0 <= min <= max <= {MAX_COMMITS_PER_DAY}'
+        )
+    rng = random.Random(args.seed)
     
     # Generate date range
     if args.start_date:
@@ -263,12 +351,11 @@ def main():
         end_date = start_date + timedelta(days=30 * args.months)
     
     # Collect all workdays
-    workdays = []
-    current = start_date
-    while current < end_date:
-        if is_workday(current):
-            workdays.append(current)
-        current += timedelta(days=1)
+    workdays = [
+        datetime.fromordinal(ordinal)
+        for ordinal in range(start_date.toordinal(), end_date.toordinal())
+        if is_workday(ordinal)
+    ]
     
     # Simulate vacation days (random workdays off)
     # Default to ~8% of workdays (about 20 days per year)
@@ -278,28 +365,36 @@ def main():
     
     if vacation_days > 0:
         vacation_days = min(vacation_days, len(workdays) - 1)  # Keep at least one workday
-        vacation_day_list = random.sample(workdays, vacation_days)
-        workdays = [d for d in workdays if d not in vacation_day_list]
+        vacation_indices = set(rng.sample(range(len(workdays)), vacation_days))
+        workdays = [d for i, d in enumerate(workdays) if i not in vacation_indices]
     
     print(f"Generating commits from {start_date.date()} to {end_date.date()}")
     total_workdays_before_vacation = len(workdays) + vacation_days
     print(f"Total workdays: {len(workdays)} (excluded {vacation_days} vacation days)")
     
     # Generate commits for each workday
-    all_commits = []
-    for workday in workdays:
-        num_commits = random.randint(args.min_commits, args.max_commits)
-        day_commits = generate_commits_for_day(workday, num_commits, args.file)
-        all_commits.extend(day_commits)
+    # Each day gets its own seed so the result doesn't depend on --jobs
+    tasks = [
+        (workday, rng.randint(args.min_commits, args.max_commits), rng.getrandbits(64))
+        for workday in workdays
+    ]
+    if args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            day_results = list(executor.map(generate_seeded_day, tasks, chunksize=64))
+    else:
+        day_results = map(generate_seeded_day, tasks)
+    all_commits = list(chain.from_iterable(day_results))
     
     print(f"Total commits to generate: {len(all_commits)}")
     
-    # Generate shell script
-    script_content = generate_shell_script(all_commits, args.file, args.output)
-    
-    output_path = Path(args.output)
-    output_path.write_text(script_content)
-    output_path.chmod(0o755)
+    # Stream the encoded script straight to a raw fd through a large buffer
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0)
+    fd = os.open(args.output, flags, 0o755)
+    with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+        f.writelines(
+            block.encode('utf-8') for block in stream_shell_script(all_commits, args.file)
+        )
+    os.chmod(args.output, 0o755)
     
     print(f"\nGenerated: {args.output}")
     print(f"\nTo use:")
@@ -308,7 +403,7 @@ def main():
     print(f"  3. ./{args.output}")
     print(f"\nPreview of first 5 commits:")
     for commit in all_commits[:5]:
-        print(f"  [{commit['timestamp']}] {commit['message']}")
+        print(f"  [{commit.timestamp}] {commit.message}")
 
 
 if __name__ == '__main__':